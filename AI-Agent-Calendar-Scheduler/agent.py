@@ -1,425 +1,807 @@
-
-# AI Calendar Scheduling Agent
-# Author: Divyank Malik
-# Date: December 2025
-
-
-import json
-import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
-import random
-
-
-class MeetingStatus(Enum):
-    """Enum for meeting status"""
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    CANCELLED = "cancelled"
-
-
-@dataclass
-class CalendarEvent:
-    """Represents a calendar event"""
-    id: str
-    title: str
-    start_time: datetime
-    end_time: datetime
-    attendees: List[str]
-    status: str
-    
-    def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "attendees": self.attendees,
-            "status": self.status
-        }
-
-
-@dataclass
-class MeetingRequest:
-    """Represents a meeting request from a user"""
-    requester_name: str
-    requester_email: str
-    purpose: str
-    duration_minutes: int
-    preferred_dates: Optional[List[datetime]] = None
-
-
-class CalendarDatabase:
-    """Simulates a calendar database with dummy data"""
-    
-    def __init__(self):
-        self.events: List[CalendarEvent] = []
-        self._generate_dummy_events()
-    
-    def _generate_dummy_events(self):
-        """Generate random calendar events for testing"""
-        base_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # Generate events for next 14 days
-        event_titles = [
-            "Team Standup",
-            "Client Meeting",
-            "Code Review",
-            "Project Planning",
-            "1-on-1 with Manager",
-            "Design Review",
-            "Architecture Discussion",
-            "Sprint Retrospective",
-            "Product Demo",
-            "Training Session"
-        ]
-        
-        event_id = 1
-        for day_offset in range(14):
-            current_date = base_date + timedelta(days=day_offset)
-            
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                continue
-            
-            # Generate 2-4 random meetings per day
-            num_meetings = random.randint(2, 4)
-            used_hours = set()
-            
-            for _ in range(num_meetings):
-                # Random hour between 9 AM and 5 PM
-                hour = random.randint(9, 16)
-                while hour in used_hours:
-                    hour = random.randint(9, 16)
-                used_hours.add(hour)
-                
-                start_time = current_date.replace(hour=hour)
-                duration = random.choice([30, 60, 90])
-                end_time = start_time + timedelta(minutes=duration)
-                
-                event = CalendarEvent(
-                    id=f"evt_{event_id}",
-                    title=random.choice(event_titles),
-                    start_time=start_time,
-                    end_time=end_time,
-                    attendees=[f"user{random.randint(1, 5)}@company.com"],
-                    status="confirmed"
-                )
-                self.events.append(event)
-                event_id += 1
-    
-    def get_events_in_range(self, start: datetime, end: datetime) -> List[CalendarEvent]:
-        """Get all events within a time range"""
-        return [
-            event for event in self.events
-            if event.start_time >= start and event.end_time <= end
-        ]
-    
-    def add_event(self, event: CalendarEvent):
-        """Add a new event to the calendar"""
-        self.events.append(event)
-        print(f"✓ Event added: {event.title} on {event.start_time.strftime('%Y-%m-%d %H:%M')}")
-    
-    def is_time_slot_available(self, start_time: datetime, end_time: datetime) -> bool:
-        """Check if a time slot is available"""
-        for event in self.events:
-            # Check for overlap
-            if (start_time < event.end_time and end_time > event.start_time):
-                return False
-        return True
-
-
-class NaturalLanguageProcessor:
-    """Processes natural language meeting requests"""
-    
-    @staticmethod
-    def extract_meeting_info(text: str) -> Dict:
-        """Extract meeting information from natural language text"""
-        text_lower = text.lower()
-        
-        # Extract duration
-        duration = 60  # default
-        duration_patterns = [
-            (r'(\d+)\s*(?:minute|min)', 1),
-            (r'(\d+)\s*(?:hour|hr)', 60),
-            (r'half\s*hour', 30),
-            (r'an\s*hour', 60)
-        ]
-        
-        for pattern, multiplier in duration_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                if isinstance(multiplier, int) and multiplier == 30:
-                    duration = 30
-                elif isinstance(multiplier, int) and multiplier == 60:
-                    duration = 60
-                else:
-                    duration = int(match.group(1)) * multiplier
-                break
-        
-        # Extract purpose/topic
-        purpose_keywords = ['discuss', 'about', 'regarding', 'talk about', 'meeting about']
-        purpose = "General Meeting"
-        for keyword in purpose_keywords:
-            if keyword in text_lower:
-                idx = text_lower.find(keyword)
-                purpose = text[idx:idx+50].strip()
-                break
-        
-        return {
-            'duration': duration,
-            'purpose': purpose
-        }
-
-
-class SchedulingAgent:
-    """Main AI agent for scheduling meetings"""
-    
-    def __init__(self):
-        self.calendar = CalendarDatabase()
-        self.nlp = NaturalLanguageProcessor()
-        self.pending_requests: Dict[str, Tuple[MeetingRequest, List[datetime]]] = {}
-        
-    def process_meeting_request(self, requester_name: str, requester_email: str, 
-                                message: str) -> Dict:
-        """
-        Process a meeting request and suggest available time slots
-        
-        Args:
-            requester_name: Name of the person requesting the meeting
-            requester_email: Email of the requester
-            message: Natural language meeting request
-            
-        Returns:
-            Dictionary with suggested time slots
-        """
-        print(f"\n{'='*60}")
-        print(f"Processing meeting request from {requester_name}")
-        print(f"Message: {message}")
-        print(f"{'='*60}")
-        
-        # Extract meeting details using NLP
-        meeting_info = self.nlp.extract_meeting_info(message)
-        duration = meeting_info['duration']
-        purpose = meeting_info['purpose']
-        
-        print(f"\n📋 Extracted Information:")
-        print(f"   Duration: {duration} minutes")
-        print(f"   Purpose: {purpose}")
-        
-        # Find available slots
-        available_slots = self._find_available_slots(duration, num_slots=5)
-        
-        if not available_slots:
-            return {
-                "status": "error",
-                "message": "No available slots found in the next 14 days"
-            }
-        
-        # Create meeting request
-        request = MeetingRequest(
-            requester_name=requester_name,
-            requester_email=requester_email,
-            purpose=purpose,
-            duration_minutes=duration
-        )
-        
-        # Store pending request
-        request_id = f"req_{len(self.pending_requests) + 1}"
-        self.pending_requests[request_id] = (request, available_slots)
-        
-        print(f"\n💡 Available Time Slots:")
-        for i, slot in enumerate(available_slots, 1):
-            print(f"   {i}. {slot.strftime('%A, %B %d, %Y at %I:%M %p')}")
-        
-        return {
-            "status": "success",
-            "request_id": request_id,
-            "available_slots": [slot.isoformat() for slot in available_slots],
-            "message": f"Found {len(available_slots)} available time slots"
-        }
-    
-    def _find_available_slots(self, duration_minutes: int, num_slots: int = 5) -> List[datetime]:
-        """Find available time slots for a meeting"""
-        available_slots = []
-        current_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # Search for next 14 days
-        for day_offset in range(14):
-            if len(available_slots) >= num_slots:
-                break
-                
-            check_date = current_date + timedelta(days=day_offset)
-            
-            # Skip weekends
-            if check_date.weekday() >= 5:
-                continue
-            
-            # Check each hour from 9 AM to 5 PM
-            for hour in range(9, 17):
-                if len(available_slots) >= num_slots:
-                    break
-                    
-                start_time = check_date.replace(hour=hour)
-                end_time = start_time + timedelta(minutes=duration_minutes)
-                
-                # Don't suggest slots after 5 PM
-                if end_time.hour >= 17:
-                    continue
-                
-                if self.calendar.is_time_slot_available(start_time, end_time):
-                    available_slots.append(start_time)
-        
-        return available_slots
-    
-    def confirm_meeting(self, request_id: str, slot_index: int) -> Dict:
-        """
-        Confirm a meeting for a specific time slot
-        
-        Args:
-            request_id: ID of the pending request
-            slot_index: Index of the chosen time slot (0-based)
-            
-        Returns:
-            Dictionary with confirmation status
-        """
-        if request_id not in self.pending_requests:
-            return {
-                "status": "error",
-                "message": "Request ID not found"
-            }
-        
-        request, available_slots = self.pending_requests[request_id]
-        
-        if slot_index < 0 or slot_index >= len(available_slots):
-            return {
-                "status": "error",
-                "message": "Invalid slot index"
-            }
-        
-        chosen_slot = available_slots[slot_index]
-        end_time = chosen_slot + timedelta(minutes=request.duration_minutes)
-        
-        # Create calendar event
-        event = CalendarEvent(
-            id=f"evt_{len(self.calendar.events) + 1}",
-            title=f"Meeting with {request.requester_name}",
-            start_time=chosen_slot,
-            end_time=end_time,
-            attendees=[request.requester_email, "owner@company.com"],
-            status=MeetingStatus.CONFIRMED.value
-        )
-        
-        # Add to calendar
-        self.calendar.add_event(event)
-        
-        # Remove from pending
-        del self.pending_requests[request_id]
-        
-        print(f"\n✅ Meeting Confirmed!")
-        print(f"   With: {request.requester_name}")
-        print(f"   Time: {chosen_slot.strftime('%A, %B %d, %Y at %I:%M %p')}")
-        print(f"   Duration: {request.duration_minutes} minutes")
-        
-        return {
-            "status": "success",
-            "message": "Meeting confirmed",
-            "event": event.to_dict()
-        }
-    
-    def view_calendar(self, days: int = 7):
-        """Display calendar events for the next N days"""
-        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        end = start + timedelta(days=days)
-        
-        events = self.calendar.get_events_in_range(start, end)
-        events.sort(key=lambda x: x.start_time)
-        
-        print(f"\n📅 Calendar for next {days} days:")
-        print(f"{'='*60}")
-        
-        current_date = None
-        for event in events:
-            event_date = event.start_time.date()
-            if event_date != current_date:
-                current_date = event_date
-                print(f"\n{event.start_time.strftime('%A, %B %d, %Y')}")
-                print("-" * 60)
-            
-            print(f"  {event.start_time.strftime('%I:%M %p')} - {event.end_time.strftime('%I:%M %p')} | {event.title}")
-
-
-def main():
-    """Demo of the calendar agent"""
-    print("🤖 AI Calendar Scheduling Agent")
-    print("=" * 60)
-    
-    # Initialize agent
-    agent = SchedulingAgent()
-    
-    # Display current calendar
-    agent.view_calendar(days=7)
-    
-    # Simulate meeting requests
-    print("\n\n" + "="*60)
-    print("SIMULATING MEETING REQUESTS")
-    print("="*60)
-    
-    # Request 1
-    result1 = agent.process_meeting_request(
-        requester_name="John Smith",
-        requester_email="john.smith@client.com",
-        message="Hi, I'd like to discuss the Q1 project proposal. Can we meet for an hour?"
-    )
-    
-    if result1['status'] == 'success':
-        # Accept first slot
-        agent.confirm_meeting(result1['request_id'], 0)
-    
-    # Request 2
-    result2 = agent.process_meeting_request(
-        requester_name="Sarah Johnson",
-        requester_email="sarah.j@partner.com",
-        message="Need to talk about the API integration. 30 minutes should be enough."
-    )
-    
-    if result2['status'] == 'success':
-        # Accept second slot
-        agent.confirm_meeting(result2['request_id'], 1)
-    
-    # Request 3
-    result3 = agent.process_meeting_request(
-        requester_name="Mike Chen",
-        requester_email="mike.chen@startup.io",
-        message="Can we have a quick 45-minute meeting regarding the partnership opportunity?"
-    )
-    
-    if result3['status'] == 'success':
-        # Accept third slot
-        agent.confirm_meeting(result3['request_id'], 2)
-    
-    # Display updated calendar
-    print("\n\n")
-    agent.view_calendar(days=7)
-    
-    # Export calendar to JSON
-    print("\n\n" + "="*60)
-    print("EXPORTING CALENDAR DATA")
-    print("="*60)
-    
-    calendar_data = {
-        "events": [event.to_dict() for event in agent.calendar.events],
-        "total_events": len(agent.calendar.events)
-    }
-    
-    with open("calendar_export.json", "w") as f:
-        json.dump(calendar_data, f, indent=2)
-    
-    print("✓ Calendar exported to calendar_export.json")
-
-
-if __name__ == "__main__":
+
+# AI Calendar Scheduling Agent
+# Author: Divyank Malik
+# Date: December 2025
+
+
+import bisect
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+from enum import Enum
+from functools import lru_cache
+from itertools import accumulate, count, islice
+import random
+
+# Optional acceleration: when numpy/numba are installed the slot search
+# runs as a compiled loop over int64 epoch-second arrays; otherwise the
+# agent falls back to the pure-stdlib path below.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# Optional acceleration: orjson serializes straight to bytes in C,
+# roughly an order of magnitude faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Precompiled NLP scanner: every duration form and purpose keyword lives
+# in one fused alternation, so a single left-to-right pass recovers both
+# facts (multi-pattern matching in the Aho-Corasick style, but with the
+# stdlib engine - no extra dependency). re.I makes a per-call
+# text.lower() copy unnecessary.
+_INFO_RE = re.compile(
+    r"(?P<min>\d+)\s*(?:minute|min)"
+    r"|(?P<hr>\d+)\s*(?:hour|hr)"
+    r"|(?P<half>half\s*hour)"
+    r"|(?P<an>an\s*hour)"
+    r"|(?P<purpose>discuss|about|regarding|talk\s+about|meeting\s+about)",
+    re.I,
+)
+# Prebound method: skips the pattern-object attribute lookup on each
+# extraction
+_info_scan = _INFO_RE.finditer
+
+
+# Output indirection: library code prints through _log so callers (and
+# the test suite) can silence it by rebinding one name instead of
+# redirecting sys.stdout and still paying for string formatting
+_log = print
+
+# Database-level messages go through logging instead: with no handler
+# configured they short-circuit before any string formatting happens,
+# so callers that don't care (tests, bulk loads) pay ~nothing
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _format_dt(dt: datetime, fmt: str) -> str:
+    """Cached strftime.
+
+    The same event times get re-formatted every time the calendar is
+    viewed or a slot is echoed back; strftime is a locale-aware parse of
+    the format string on each call, so memoizing (dt, fmt) pairs makes
+    repeat formatting a dict hit.
+    """
+    return dt.strftime(fmt)
+
+
+_ONE_DAY = timedelta(days=1)
+
+# (second, anchor) pair backing _search_anchor
+_anchor_cache = (0, None)
+
+
+def _search_anchor() -> datetime:
+    """Today's 9 AM slot-search anchor, recomputed at most once per second.
+
+    High-volume ingestion calls the slot search per request; a
+    per-second cache replaces the datetime.now() + replace() pair (two
+    allocations and a syscall) with a tuple read on the common path. A
+    racing refresh is harmless - both threads compute the same anchor.
+    """
+    global _anchor_cache
+    now_s = int(time.time())
+    cached_s, anchor = _anchor_cache
+    if anchor is None or cached_s != now_s:
+        anchor = datetime.now().replace(hour=9, minute=0, second=0,
+                                        microsecond=0)
+        _anchor_cache = (now_s, anchor)
+    return anchor
+
+
+# Business-day offsets within the 14-day search window, keyed by the
+# anchor's weekday. Weekdays repeat mod 7, so the table is built once
+# and a skeleton rebuild is a branch-free lookup instead of a per-day
+# weekday test.
+_BUSINESS_OFFSETS = tuple(
+    tuple(d for d in range(14) if (weekday + d) % 7 < 5)
+    for weekday in range(7)
+)
+
+
+@lru_cache(maxsize=8)
+def _slot_skeleton(anchor: datetime):
+    """Business days of the 14-day search window starting at anchor.
+
+    Returns the business days' midnights as epoch seconds. The skeleton
+    only depends on the anchor, which is stable for a whole day, so it
+    is cached across requests instead of redoing 14 timedelta/weekday
+    computations each time a slot search runs.
+    """
+    # One weekday() call selects the window's business days from the
+    # precomputed table. Adding day-multiples of a timedelta (rather
+    # than epoch-second arithmetic) keeps midnights aligned across DST
+    # transitions.
+    midnight = anchor.replace(hour=0)
+    return tuple(int((midnight + day_offset * _ONE_DAY).timestamp())
+                 for day_offset in _BUSINESS_OFFSETS[anchor.weekday()])
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _find_slots_nb(starts, max_ends, day_starts, duration_s, hour_lo,
+                       hour_hi, max_slots, out):
+        """Compiled slot search over int64 epoch-second arrays.
+
+        starts is the calendar's event starts in sorted order and
+        max_ends the running maximum of end times, so each candidate is
+        settled by a binary search plus one comparison instead of a scan
+        over the events. day_starts holds the midnight timestamps of the
+        business days to search. Free slot starts are written into out;
+        returns how many were found.
+        """
+        count = 0
+        n_events = starts.shape[0]
+        # Last start hour whose meeting still ends before closing time,
+        # hoisted out of the loops instead of checking every candidate
+        hour_stop = (hour_hi * 3600 - duration_s - 1) // 3600 + 1
+        if hour_stop > hour_hi:
+            hour_stop = hour_hi
+        for d in range(day_starts.shape[0]):
+            day = day_starts[d]
+            for hour in range(hour_lo, hour_stop):
+                s = day + hour * 3600
+                e = s + duration_s
+                # Binary search for the first event starting at/after e
+                lo = 0
+                hi = n_events
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if starts[mid] < e:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if lo == 0 or max_ends[lo - 1] <= s:
+                    out[count] = s
+                    count += 1
+                    if count >= max_slots:
+                        return count
+        return count
+else:
+    _find_slots_nb = None
+
+if np is not None:
+    @lru_cache(maxsize=32)
+    def _candidate_grid(midnight_epochs: tuple, duration_s: int):
+        """Working-hours candidate starts for a search window, as int64.
+
+        The grid depends only on the cached business-day skeleton and
+        the meeting duration, so repeated searches share one array
+        instead of rebuilding the broadcast per request. Weekends are
+        excluded by the skeleton and the hour offsets keep every
+        candidate's meeting inside working hours by construction.
+        """
+        days = np.array(midnight_epochs, dtype=np.int64)
+        hour_offsets = np.arange(9, 17, dtype=np.int64) * 3600
+        hour_offsets = hour_offsets[hour_offsets + duration_s < 17 * 3600]
+        return (days[:, None] + hour_offsets[None, :]).ravel()
+else:
+    _candidate_grid = None
+
+
+class MeetingStatus(str, Enum):
+    """Enum for meeting status.
+
+    The str mixin lets members be stored and compared as plain strings
+    (C-level equality, no .value hop) while keeping the JSON wire format
+    unchanged.
+    """
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    CANCELLED = "cancelled"
+
+
+@dataclass(slots=True)
+class CalendarEvent:
+    """Represents a calendar event"""
+    id: str
+    title: str
+    start_time: datetime
+    end_time: datetime
+    attendees: List[str]
+    status: str
+    # Epoch-second mirrors of start/end, computed once at construction so
+    # index (re)builds don't call datetime.timestamp() per event
+    start_ts: int = field(init=False, repr=False, compare=False)
+    end_ts: int = field(init=False, repr=False, compare=False)
+    # Lazily built to_dict result; events are never mutated after
+    # construction, so the serialized form can be computed once
+    _dict_cache: Optional[Dict] = field(init=False, default=None,
+                                        repr=False, compare=False)
+
+    def __post_init__(self):
+        self.start_ts = int(self.start_time.timestamp())
+        self.end_ts = int(self.end_time.timestamp())
+
+    def __hash__(self):
+        # IDs are unique per event, so hashing the id alone lets events
+        # live in dicts/sets without comparing every field (dataclasses
+        # with eq=True are otherwise unhashable)
+        return hash(self.id)
+
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "title": self.title,
+                "start_time": self.start_time.isoformat(),
+                "end_time": self.end_time.isoformat(),
+                "attendees": self.attendees,
+                "status": self.status
+            }
+        return self._dict_cache
+
+
+@dataclass(slots=True)
+class MeetingRequest:
+    """Represents a meeting request from a user"""
+    requester_name: str
+    requester_email: str
+    purpose: str
+    duration_minutes: int
+    preferred_dates: Optional[Tuple[datetime, ...]] = None
+
+    def __post_init__(self):
+        # Accept any iterable of dates but store a tuple: requests are
+        # never mutated after construction, and a tuple is smaller and
+        # faster to iterate than a list
+        if self.preferred_dates is not None:
+            self.preferred_dates = tuple(self.preferred_dates)
+
+
+class PendingRequest(NamedTuple):
+    """A stored meeting request plus the slots offered for it.
+
+    A NamedTuple keeps the record as compact as a plain tuple (no
+    per-instance __dict__) while still unpacking like one.
+    """
+    request: MeetingRequest
+    slots: List[datetime]
+
+
+class CalendarDatabase:
+    """Simulates a calendar database with dummy data"""
+    
+    def __init__(self):
+        self.events: List[CalendarEvent] = []
+        # SoA time index: event start/end times as epoch seconds in lists
+        # parallel to self.events, sorted by start. Integer comparisons in
+        # the query paths replace boxed datetime comparisons; event times
+        # are treated as having whole-second resolution.
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        # Running max of _ends: the interval-tree augmentation for sorted
+        # intervals. Any event starting before a query's end conflicts
+        # iff the max end among those events exceeds the query's start,
+        # which makes the availability check a single bisect.
+        self._max_ends: List[int] = []
+        # numpy mirrors of the lists above, built lazily for the
+        # vectorized/compiled paths (None when numpy is unavailable)
+        self._starts_s = None
+        self._ends_s = None
+        self._max_ends_s = None
+        # id -> event index for O(1) lookup alongside the sorted list
+        self._events_by_id: Dict[str, CalendarEvent] = {}
+        self._generate_dummy_events()
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Re-sort events and rebuild the epoch-second time index.
+
+        Called lazily whenever self.events was mutated directly (e.g. in
+        tests) instead of through add_event.
+        """
+        self.events.sort(key=lambda event: event.start_ts)
+        self._starts = [event.start_ts for event in self.events]
+        self._ends = [event.end_ts for event in self.events]
+        self._max_ends = list(accumulate(self._ends, max))
+        self._events_by_id = {event.id: event for event in self.events}
+        self._starts_s = None
+        self._ends_s = None
+
+    def _ensure_index(self):
+        """Rebuild the index if self.events was modified behind our back"""
+        if len(self._starts) != len(self.events):
+            self._rebuild_index()
+    
+    def _generate_dummy_events(self):
+        """Generate random calendar events for testing"""
+        base_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        
+        # Generate events for next 14 days
+        event_titles = [
+            "Team Standup",
+            "Client Meeting",
+            "Code Review",
+            "Project Planning",
+            "1-on-1 with Manager",
+            "Design Review",
+            "Architecture Discussion",
+            "Sprint Retrospective",
+            "Product Demo",
+            "Training Session"
+        ]
+        
+        # Batched construction: the business days of the 14-day window
+        # come straight from the precomputed offsets table (no per-day
+        # weekday() test), and the per-event random draws are taken as
+        # one choices() call per attribute instead of one RNG call per
+        # event. Each day gets 2-4 meetings at distinct hours between
+        # 9 AM and 5 PM.
+        business_days = [base_date + day_offset * _ONE_DAY
+                         for day_offset in _BUSINESS_OFFSETS[base_date.weekday()]]
+        hours_per_day = [random.sample(range(9, 17), random.randint(2, 4))
+                         for _ in business_days]
+        total = sum(len(hours) for hours in hours_per_day)
+        titles = random.choices(event_titles, k=total)
+        durations = random.choices([30, 60, 90], k=total)
+        users = random.choices(range(1, 6), k=total)
+
+        event_id = 0
+        for current_date, hours in zip(business_days, hours_per_day):
+            for hour in hours:
+                start_time = current_date.replace(hour=hour)
+                self.events.append(CalendarEvent(
+                    id=f"evt_{event_id + 1}",
+                    title=titles[event_id],
+                    start_time=start_time,
+                    end_time=start_time + timedelta(minutes=durations[event_id]),
+                    attendees=[f"user{users[event_id]}@company.com"],
+                    status="confirmed"
+                ))
+                event_id += 1
+    
+    def event_times_s(self):
+        """Event times as parallel sorted int64 epoch-second arrays.
+
+        Returns (starts, ends, running max of ends), rebuilt lazily
+        whenever the event list changed; requires numpy.
+        """
+        self._ensure_index()
+        if self._starts_s is None or len(self._starts_s) != len(self.events):
+            self._starts_s = np.array(self._starts, dtype=np.int64)
+            self._ends_s = np.array(self._ends, dtype=np.int64)
+            self._max_ends_s = np.array(self._max_ends, dtype=np.int64)
+        return self._starts_s, self._ends_s, self._max_ends_s
+
+    def get_events_in_range(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """Get all events within a time range, sorted by start time"""
+        self._ensure_index()
+        # Bisect to the window of events starting within [start, end],
+        # then filter exactly on the datetimes
+        lo = bisect.bisect_left(self._starts, int(start.timestamp()))
+        hi = bisect.bisect_right(self._starts, int(end.timestamp()))
+        return [
+            event for event in self.events[lo:hi]
+            if event.start_time >= start and event.end_time <= end
+        ]
+
+    def events_by_day(self, start: datetime, end: datetime) -> Dict[date, List[CalendarEvent]]:
+        """Events within a time range, grouped by calendar day.
+
+        Prefetches the whole window in one bisected pass so callers that
+        walk a range day-by-day don't issue one query per day; days come
+        out in chronological order.
+        """
+        by_day: Dict[date, List[CalendarEvent]] = {}
+        for event in self.get_events_in_range(start, end):
+            by_day.setdefault(event.start_time.date(), []).append(event)
+        return by_day
+
+    def add_event(self, event: CalendarEvent):
+        """Add a new event to the calendar, keeping events sorted by start time"""
+        self._ensure_index()
+        start_s = event.start_ts
+        end_s = event.end_ts
+        idx = bisect.bisect_right(self._starts, start_s)
+        self._starts.insert(idx, start_s)
+        self._ends.insert(idx, end_s)
+        self.events.insert(idx, event)
+        # Splice the running-max-of-ends augmentation: the new entry takes
+        # the prefix max so far, and the carry propagates right only while
+        # it raises existing maxima
+        prefix_max = max(end_s, self._max_ends[idx - 1]) if idx else end_s
+        self._max_ends.insert(idx, prefix_max)
+        for j in range(idx + 1, len(self._max_ends)):
+            if self._max_ends[j] >= self._max_ends[j - 1]:
+                break
+            self._max_ends[j] = self._max_ends[j - 1]
+        self._events_by_id[event.id] = event
+        self._starts_s = None
+        self._ends_s = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✓ Event added: %s on %s", event.title,
+                        _format_dt(event.start_time, '%Y-%m-%d %H:%M'))
+
+    def get_event(self, event_id: str) -> Optional[CalendarEvent]:
+        """Look up an event by id in O(1)"""
+        self._ensure_index()
+        return self._events_by_id.get(event_id)
+
+    def is_time_slot_available(self, start_time: datetime, end_time: datetime) -> bool:
+        """Check if a time slot is available"""
+        return self._is_free_s(int(start_time.timestamp()),
+                               int(end_time.timestamp()))
+
+    def _is_free_s(self, start_s: int, end_s: int) -> bool:
+        """Availability check on epoch seconds; the core the hot loops use.
+
+        O(log n): only events starting before end_s can overlap, and the
+        running-max-of-ends augmentation answers whether any of them runs
+        past start_s without scanning them.
+        """
+        self._ensure_index()
+        i = bisect.bisect_left(self._starts, end_s)
+        return i == 0 or self._max_ends[i - 1] <= start_s
+
+
+class NaturalLanguageProcessor:
+    """Processes natural language meeting requests"""
+    
+    @staticmethod
+    def extract_meeting_info(text: str) -> Dict:
+        """Extract meeting information from natural language text"""
+        duration, purpose = NaturalLanguageProcessor._extract_cached(text)
+        # Hand each caller a fresh dict so the cached entry can't be
+        # mutated through the result
+        return {
+            'duration': duration,
+            'purpose': purpose
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _extract_cached(text: str) -> Tuple[int, str]:
+        """Cached extraction core; returns (duration_minutes, purpose).
+
+        Identical request messages (retries, templated invites) skip the
+        regex scans entirely on repeat calls.
+        """
+        duration = 60  # default
+        purpose = "General Meeting"
+        found_duration = False
+        found_purpose = False
+
+        # One pass: the first duration-shaped match and the first purpose
+        # keyword each win, then the scan stops early
+        for match in _info_scan(text):
+            group = match.lastgroup
+            if group == 'purpose':
+                if not found_purpose:
+                    found_purpose = True
+                    idx = match.start()
+                    purpose = text[idx:idx+50].strip()
+            elif not found_duration:
+                found_duration = True
+                if group == 'min':
+                    duration = int(match.group('min'))
+                elif group == 'hr':
+                    duration = int(match.group('hr')) * 60
+                elif group == 'half':
+                    duration = 30
+                else:  # 'an hour'
+                    duration = 60
+            if found_duration and found_purpose:
+                break
+
+        return duration, purpose
+
+
+class SchedulingAgent:
+    """Main AI agent for scheduling meetings"""
+    
+    def __init__(self):
+        self.calendar = CalendarDatabase()
+        self.nlp = NaturalLanguageProcessor()
+        self.pending_requests: Dict[int, PendingRequest] = {}
+        # Monotonic counter for request IDs: O(1) to generate and never
+        # reuses an ID after a request is confirmed and removed
+        self._request_ids = count(1)
+        # Guards the pending-request table when requests are ingested
+        # concurrently via process_meeting_requests
+        self._pending_lock = threading.Lock()
+        
+    def process_meeting_request(self, requester_name: str, requester_email: str, 
+                                message: str) -> Dict:
+        """
+        Process a meeting request and suggest available time slots
+        
+        Args:
+            requester_name: Name of the person requesting the meeting
+            requester_email: Email of the requester
+            message: Natural language meeting request
+            
+        Returns:
+            Dictionary with suggested time slots
+        """
+        _log(f"\n{'='*60}")
+        _log(f"Processing meeting request from {requester_name}")
+        _log(f"Message: {message}")
+        _log(f"{'='*60}")
+        
+        # Extract meeting details using NLP
+        meeting_info = self.nlp.extract_meeting_info(message)
+        duration = meeting_info['duration']
+        purpose = meeting_info['purpose']
+        
+        _log(f"\n📋 Extracted Information:")
+        _log(f"   Duration: {duration} minutes")
+        _log(f"   Purpose: {purpose}")
+        
+        # Find available slots
+        available_slots = self._find_available_slots(duration, num_slots=5)
+        
+        if not available_slots:
+            return {
+                "status": "error",
+                "message": "No available slots found in the next 14 days"
+            }
+        
+        # Create meeting request
+        request = MeetingRequest(
+            requester_name=requester_name,
+            requester_email=requester_email,
+            purpose=purpose,
+            duration_minutes=duration
+        )
+        
+        # Store pending request
+        with self._pending_lock:
+            request_id = next(self._request_ids)
+            self.pending_requests[request_id] = PendingRequest(request, available_slots)
+        
+        # Buffer the slot listing into one write instead of a syscall per slot
+        lines = ["\n💡 Available Time Slots:"]
+        lines.extend(
+            f"   {i}. {_format_dt(slot, '%A, %B %d, %Y at %I:%M %p')}"
+            for i, slot in enumerate(available_slots, 1)
+        )
+        _log("\n".join(lines))
+        
+        return {
+            "status": "success",
+            "request_id": request_id,
+            "available_slots": [slot.isoformat() for slot in available_slots],
+            "message": f"Found {len(available_slots)} available time slots"
+        }
+    
+    def process_meeting_requests(self, requests: List[Tuple[str, str, str]],
+                                 max_workers: int = 4) -> List[Dict]:
+        """
+        Process a batch of meeting requests concurrently
+
+        Args:
+            requests: List of (requester_name, requester_email, message)
+                tuples
+            max_workers: Size of the worker pool
+
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(
+                lambda args: self.process_meeting_request(*args), requests))
+
+    def _iter_free_slots(self, duration_s: int):
+        """Yield free slot starts as epoch seconds, in order.
+
+        Candidate enumeration and the availability check are fused in
+        one generator: no intermediate candidate list is built, and a
+        caller that islices the first few slots stops the walk as soon
+        as it has enough. Works in integer epoch math only - one
+        fromtimestamp per accepted slot happens at the caller.
+        """
+        midnight_epochs = _slot_skeleton(_search_anchor())
+        # Last admissible start hour (meeting must end before 5 PM),
+        # computed once instead of per candidate; for the default
+        # 60-minute meeting this is simply hours 9-15
+        hour_stop = min(17, (17 * 3600 - duration_s - 1) // 3600 + 1)
+        is_free = self.calendar._is_free_s
+        for day_s in midnight_epochs:
+            for hour in range(9, hour_stop):
+                start_s = day_s + hour * 3600
+                if is_free(start_s, start_s + duration_s):
+                    yield start_s
+
+    def _find_available_slots(self, duration_minutes: int, num_slots: int = 5) -> List[datetime]:
+        """Find available time slots for a meeting"""
+        duration_s = duration_minutes * 60
+
+        if np is not None:
+            midnight_epochs = _slot_skeleton(_search_anchor())
+            starts, ends, max_ends = self.calendar.event_times_s()
+
+            if _find_slots_nb is not None:
+                days = np.array(midnight_epochs, dtype=np.int64)
+                out = np.empty(num_slots, dtype=np.int64)
+                count = _find_slots_nb(
+                    starts, max_ends, days, duration_s, 9, 17, num_slots, out)
+                return [datetime.fromtimestamp(int(ts)) for ts in out[:count]]
+
+            # No numba: settle every candidate slot in one vectorized
+            # binary search against the sorted starts plus one comparison
+            # with the running-max ends - O(C log N) for C candidates
+            # instead of the C x N broadcast
+            cand_s = _candidate_grid(midnight_epochs, duration_s)
+            if starts.size:
+                idx = np.searchsorted(starts, cand_s + duration_s, side='left')
+                free = (idx == 0) | (max_ends[np.maximum(idx, 1) - 1] <= cand_s)
+            else:
+                free = np.ones(cand_s.shape, dtype=bool)
+            return [datetime.fromtimestamp(int(ts))
+                    for ts in cand_s[free][:num_slots]]
+
+        # Pure-Python fallback: the fused generator walks the cached
+        # business-day skeleton and islice cuts it off at num_slots
+        return [datetime.fromtimestamp(start_s)
+                for start_s in islice(self._iter_free_slots(duration_s),
+                                      num_slots)]
+    
+    def confirm_meeting(self, request_id: int, slot_index: int) -> Dict:
+        """
+        Confirm a meeting for a specific time slot
+        
+        Args:
+            request_id: ID of the pending request
+            slot_index: Index of the chosen time slot (0-based)
+            
+        Returns:
+            Dictionary with confirmation status
+        """
+        if request_id not in self.pending_requests:
+            return {
+                "status": "error",
+                "message": "Request ID not found"
+            }
+        
+        request, available_slots = self.pending_requests[request_id]
+        
+        if slot_index < 0 or slot_index >= len(available_slots):
+            return {
+                "status": "error",
+                "message": "Invalid slot index"
+            }
+        
+        chosen_slot = available_slots[slot_index]
+        end_time = chosen_slot + timedelta(minutes=request.duration_minutes)
+        
+        # Create calendar event
+        event = CalendarEvent(
+            id=f"evt_{len(self.calendar.events) + 1}",
+            title=f"Meeting with {request.requester_name}",
+            start_time=chosen_slot,
+            end_time=end_time,
+            attendees=[request.requester_email, "owner@company.com"],
+            status=MeetingStatus.CONFIRMED
+        )
+        
+        # Add to calendar
+        self.calendar.add_event(event)
+        
+        # Remove from pending
+        del self.pending_requests[request_id]
+        
+        _log(f"\n✅ Meeting Confirmed!")
+        _log(f"   With: {request.requester_name}")
+        _log(f"   Time: {_format_dt(chosen_slot, '%A, %B %d, %Y at %I:%M %p')}")
+        _log(f"   Duration: {request.duration_minutes} minutes")
+        
+        return {
+            "status": "success",
+            "message": "Meeting confirmed",
+            "event": event.to_dict()
+        }
+    
+    def view_calendar(self, days: int = 7):
+        """Display calendar events for the next N days"""
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=days)
+        
+        # Prefetch the whole window grouped by day in one indexed pass;
+        # groups arrive in chronological order
+        by_day = self.calendar.events_by_day(start, end)
+
+        # Buffer the listing and emit it in a single write
+        lines = [f"\n📅 Calendar for next {days} days:", '=' * 60]
+
+        for day_events in by_day.values():
+            lines.append(f"\n{_format_dt(day_events[0].start_time, '%A, %B %d, %Y')}")
+            lines.append("-" * 60)
+            for event in day_events:
+                lines.append(f"  {_format_dt(event.start_time, '%I:%M %p')} - {_format_dt(event.end_time, '%I:%M %p')} | {event.title}")
+        _log("\n".join(lines))
+
+
+def main():
+    """Demo of the calendar agent"""
+    # The demo wants to see the database messages that are silent by
+    # default (see logger above)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    print("🤖 AI Calendar Scheduling Agent")
+    print("=" * 60)
+    
+    # Initialize agent
+    agent = SchedulingAgent()
+    
+    # Display current calendar
+    agent.view_calendar(days=7)
+    
+    # Simulate meeting requests
+    print("\n\n" + "="*60)
+    print("SIMULATING MEETING REQUESTS")
+    print("="*60)
+    
+    # Request 1
+    result1 = agent.process_meeting_request(
+        requester_name="John Smith",
+        requester_email="john.smith@client.com",
+        message="Hi, I'd like to discuss the Q1 project proposal. Can we meet for an hour?"
+    )
+    
+    if result1['status'] == 'success':
+        # Accept first slot
+        agent.confirm_meeting(result1['request_id'], 0)
+    
+    # Request 2
+    result2 = agent.process_meeting_request(
+        requester_name="Sarah Johnson",
+        requester_email="sarah.j@partner.com",
+        message="Need to talk about the API integration. 30 minutes should be enough."
+    )
+    
+    if result2['status'] == 'success':
+        # Accept second slot
+        agent.confirm_meeting(result2['request_id'], 1)
+    
+    # Request 3
+    result3 = agent.process_meeting_request(
+        requester_name="Mike Chen",
+        requester_email="mike.chen@startup.io",
+        message="Can we have a quick 45-minute meeting regarding the partnership opportunity?"
+    )
+    
+    if result3['status'] == 'success':
+        # Accept third slot
+        agent.confirm_meeting(result3['request_id'], 2)
+    
+    # Display updated calendar
+    print("\n\n")
+    agent.view_calendar(days=7)
+    
+    # Export calendar to JSON
+    print("\n\n" + "="*60)
+    print("EXPORTING CALENDAR DATA")
+    print("="*60)
+    
+    calendar_data = {
+        "events": [event.to_dict() for event in agent.calendar.events],
+        "total_events": len(agent.calendar.events)
+    }
+    
+    if orjson is not None:
+        with open("calendar_export.json", "wb") as f:
+            f.write(orjson.dumps(calendar_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open("calendar_export.json", "w") as f:
+            json.dump(calendar_data, f, indent=2)
+    
+    print("✓ Calendar exported to calendar_export.json")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file